@@ -1,25 +1,52 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
-import requests
+import time
+import orjson
+import asyncio
+import aiohttp
 import click
+import concurrent.futures
+import threading
 import subprocess
-import platform
+import functools
+import collections
 from pathlib import Path
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
-from rich import print as rprint
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
-from rich.live import Live
-from rich.layout import Layout
 
 console = Console()
 
+@functools.lru_cache(maxsize=None)
+def _in_git_worktree(cwd):
+    """Check whether cwd is inside a git working tree (memoized per path)."""
+    result = subprocess.run(
+        ['git', 'rev-parse', '--is-inside-work-tree'],
+        cwd=cwd,
+        capture_output=True,
+        text=True
+    )
+    return result.returncode == 0
+
 class GitHubDownloader:
-    def __init__(self, save_path=None):
+    CACHE_DIR = os.path.join(str(Path.home()), ".cache", "github-multi-downloader")
+    SHARED_STORE_NAME = ".shared-objects"
+
+    def __init__(self, save_path=None, full_history=False, jobs=None, tokens=None):
         self.api_base = "https://api.github.com"
+        self.full_history = full_history
+        self.jobs = jobs
+        if tokens is None:
+            env_tokens = os.environ.get("GITHUB_TOKENS") or os.environ.get("GITHUB_TOKEN", "")
+            tokens = [t.strip() for t in env_tokens.split(",") if t.strip()]
+        self._tokens = collections.deque(tokens)
+        self._parked_until = {}
+        self._status_cache = None
+        self._status_cache_lock = threading.Lock()
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHub-Multi-Downloader"
@@ -46,136 +73,398 @@ class GitHubDownloader:
                 
         return downloads_dir
 
+    GRAPHQL_REPOS_QUERY = """
+    query($login: String!, $cursor: String) {
+      user(login: $login) {
+        repositories(first: 100, after: $cursor, privacy: PUBLIC, ownerAffiliations: OWNER) {
+          pageInfo { hasNextPage endCursor }
+          nodes { name description stargazerCount url }
+        }
+      }
+    }
+    """
+
+    def _make_session(self, extra_headers=None):
+        """Build an aiohttp session with pooled, keep-alive connections."""
+        headers = dict(self.headers, **(extra_headers or {}))
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        return aiohttp.ClientSession(
+            headers=headers,
+            connector=connector,
+            raise_for_status=True
+        )
+
+    def _next_token(self):
+        """Rotate to the next usable token, skipping rate-limited ones."""
+        now = time.time()
+        for _ in range(len(self._tokens)):
+            token = self._tokens[0]
+            self._tokens.rotate(-1)
+            if self._parked_until.get(token, 0) <= now:
+                return token
+        return None
+
+    def _park_token(self, token, headers):
+        """Bench a rate-limited token until its limit window resets."""
+        try:
+            reset = int(headers.get("X-RateLimit-Reset", 0))
+        except (TypeError, ValueError):
+            reset = 0
+        self._parked_until[token] = reset or time.time() + 60
+
     def get_user_repos(self, username):
         """Fetch all public repositories for a given username."""
+        if self._next_token():
+            # GraphQL returns 100 repos per call at one rate-limit point each
+            return asyncio.run(self._fetch_user_repos_graphql(username))
+        return asyncio.run(self._fetch_user_repos(username))
+
+    async def _graphql_post(self, session, payload):
+        """POST a GraphQL query, rotating through tokens on rate-limit errors."""
+        token = self._next_token()
+        while True:
+            try:
+                async with session.post(
+                        f"{self.api_base}/graphql", json=payload,
+                        headers={"Authorization": f"Bearer {token}"}) as response:
+                    data = await response.json(loads=orjson.loads)
+                    # Primary rate-limit exhaustion arrives as HTTP 200 with
+                    # a RATE_LIMITED error in the payload, not as a 403/429
+                    if not any(error.get("type") == "RATE_LIMITED"
+                               for error in data.get("errors") or []):
+                        return data
+                    self._park_token(token, response.headers)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in (403, 429):
+                    raise
+                self._park_token(token, e.headers or {})
+            token = self._next_token()
+            if token is None:
+                raise RuntimeError("GitHub API rate limit exhausted on all tokens")
+
+    async def _fetch_user_repos_graphql(self, username):
+        """Fetch the repository listing via the GraphQL API."""
+        repos = []
+        cursor = None
+        async with self._make_session() as session:
+            while True:
+                payload = {
+                    "query": self.GRAPHQL_REPOS_QUERY,
+                    "variables": {"login": username, "cursor": cursor}
+                }
+                data = await self._graphql_post(session, payload)
+
+                if data.get("errors"):
+                    raise RuntimeError(data["errors"][0].get("message", "GraphQL query failed"))
+                user = data["data"]["user"]
+                if user is None:
+                    raise ValueError(f"User '{username}' not found")
+
+                page = user["repositories"]
+                for node in page["nodes"]:
+                    # Map onto the field names the REST listing uses
+                    repos.append({
+                        "name": node["name"],
+                        "description": node["description"],
+                        "stargazers_count": node["stargazerCount"],
+                        "clone_url": node["url"] + ".git",
+                    })
+                if not page["pageInfo"]["hasNextPage"]:
+                    break
+                cursor = page["pageInfo"]["endCursor"]
+        return repos
+
+    async def _fetch_user_repos(self, username):
+        """Fetch every page of the user's repository listing concurrently."""
         url = f"{self.api_base}/users/{username}/repos"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        params = {"per_page": 100, "type": "public", "sort": "pushed"}
+        cached = self._load_repo_cache(username)
+        conditional_headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+        async with self._make_session() as session:
+            # Fetch page 1 first to learn the total page count from the Link header
+            async with session.get(url, params={**params, "page": 1},
+                                   headers=conditional_headers) as response:
+                if response.status == 304:
+                    # Nothing changed upstream; serve the cached listing for free
+                    return cached["repos"]
+                self._check_rate_limit(response.headers)
+                repos = await response.json(loads=orjson.loads)
+                etag = response.headers.get("ETag")
+                last_page = self._parse_last_page(response.headers.get("Link", ""))
+
+            # Fetch any remaining pages in parallel
+            if last_page > 1:
+                pages = await asyncio.gather(
+                    *(self._fetch_repo_page(session, url, params, page)
+                      for page in range(2, last_page + 1))
+                )
+                for page in pages:
+                    repos.extend(page)
 
-    def download_repo(self, repo_url, target_dir):
-        """Download a repository using git clone."""
-        os.system(f"git clone {repo_url} {target_dir}")
+        if etag:
+            self._save_repo_cache(username, etag, repos)
+        return repos
 
-    def update_gitignore(self, username):
-        """Update .gitignore to exclude the downloaded repositories folder."""
-        # Skip .gitignore update if we're not in a git repository
+    def _repo_cache_path(self, username):
+        return os.path.join(self.CACHE_DIR, f"{username}.json")
+
+    def _load_repo_cache(self, username):
+        """Load the cached ETag and repository listing for a user, if any."""
+        try:
+            with open(self._repo_cache_path(username), 'rb') as f:
+                cached = orjson.loads(f.read())
+            if "etag" in cached and "repos" in cached:
+                return cached
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_repo_cache(self, username, etag, repos):
+        """Persist the ETag and repository listing for later conditional requests."""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(self._repo_cache_path(username), 'wb') as f:
+                f.write(orjson.dumps({"etag": etag, "repos": repos}))
+        except OSError:
+            pass  # Caching is best-effort; a missing cache just costs one request
+
+    @staticmethod
+    def _check_rate_limit(headers):
+        """Warn when the API rate limit is nearly exhausted."""
         try:
-            # Check if current directory is a git repository
+            remaining = int(headers.get("X-RateLimit-Remaining", ""))
+            reset = int(headers.get("X-RateLimit-Reset", 0))
+        except ValueError:
+            return
+        if remaining < 5:
+            wait = max(0, int(reset - time.time()))
+            console.print(f"[yellow]Warning: GitHub API rate limit nearly exhausted, "
+                          f"resets in {wait}s[/yellow]")
+
+    async def _fetch_repo_page(self, session, url, params, page):
+        """Fetch a single page of the repository listing."""
+        async with session.get(url, params={**params, "page": page}) as response:
+            return await response.json(loads=orjson.loads)
+
+    @staticmethod
+    def _parse_last_page(link_header):
+        """Extract the last page number from a GitHub Link header."""
+        match = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', link_header)
+        return int(match.group(1)) if match else 1
+
+    def _clone_command(self, repo_url, target_dir, reference=None):
+        """Build the git clone argv for a repository."""
+        # Fetch submodules too, in parallel, so they don't fall back to
+        # serial fetches on first use
+        cmd = ['git', 'clone', '--recurse-submodules', f'--jobs={self.jobs or 8}']
+        if not self.full_history:
+            # Shallow partial clone: skip old history and unneeded blobs
+            cmd += ['--depth=1', '--single-branch', '--filter=blob:none',
+                    '--shallow-submodules']
+        if reference:
+            # Reuse objects already fetched for related repos (e.g. forks)
+            cmd += ['--reference-if-able', reference, '--dissociate']
+        cmd += [repo_url, target_dir]
+        return cmd
+
+    @staticmethod
+    def _init_shared_store(base_dir):
+        """Create (or reuse) a bare repo whose object store is shared across clones."""
+        store = os.path.join(base_dir, GitHubDownloader.SHARED_STORE_NAME)
+        if not os.path.isdir(store):
             result = subprocess.run(
-                ['git', 'rev-parse', '--is-inside-work-tree'],
-                capture_output=True,
-                text=True
+                ['git', 'init', '--bare', '--quiet', store],
+                capture_output=True
             )
-            
             if result.returncode != 0:
+                return None
+        return store
+
+    def update_gitignore(self, username):
+        """Update .gitignore to exclude the downloaded repositories folder."""
+        # Skip .gitignore update if we're not in a git repository
+        try:
+            cwd = os.getcwd()
+            if not _in_git_worktree(cwd):
                 return  # Not in a git repo, so skip updating .gitignore
-                
+
             gitignore_path = ".gitignore"
             # Get relative path from current directory to downloaded repos
             # This handles the case when repos are downloaded outside the current working directory
-            cwd = os.getcwd()
             rel_path = os.path.relpath(os.path.join(self.save_path, username), cwd)
             ignore_pattern = f"{rel_path}/"
             
-            # Read existing .gitignore content
-            try:
-                with open(gitignore_path, 'r') as f:
-                    content = f.read()
-            except FileNotFoundError:
-                content = ""
-            
-            # Add the pattern if it's not already there
-            if ignore_pattern not in content:
-                with open(gitignore_path, 'a') as f:
+            # One open handles both the read and the append; a 128 KB buffer
+            # keeps even large gitignores to a single read syscall
+            with open(gitignore_path, 'a+', buffering=131072) as f:
+                f.seek(0)
+                content = f.read()
+                # Compare whole lines rather than substrings
+                patterns = set(content.splitlines())
+
+                if ignore_pattern not in patterns and ignore_pattern.rstrip('/') not in patterns:
                     if content and not content.endswith('\n'):
                         f.write('\n')
                     f.write(f"{ignore_pattern}\n")
-                console.print(f"[green]Updated .gitignore to exclude {ignore_pattern} directory[/green]")
+                    console.print(f"[green]Updated .gitignore to exclude {ignore_pattern} directory[/green]")
         except Exception as e:
             console.print(f"[yellow]Warning: Could not update .gitignore: {str(e)}[/yellow]")
 
+    def _load_status_cache(self):
+        """Lazily load the commit/date cache keyed by repository path."""
+        if self._status_cache is None:
+            # get_repo_status runs on a thread pool; without the lock two
+            # threads could both load and reassign the dict, dropping
+            # entries the other already wrote
+            with self._status_cache_lock:
+                if self._status_cache is None:
+                    try:
+                        with open(os.path.join(self.CACHE_DIR, "status.json"), 'rb') as f:
+                            self._status_cache = orjson.loads(f.read())
+                    except (OSError, ValueError):
+                        self._status_cache = {}
+        return self._status_cache
+
+    def _save_status_cache(self):
+        """Persist the commit/date cache for future runs."""
+        if self._status_cache is None:
+            return
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(os.path.join(self.CACHE_DIR, "status.json"), 'wb') as f:
+                f.write(orjson.dumps(self._status_cache))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _ref_fingerprint(repo_path):
+        """Mtimes of the ref files that change whenever HEAD moves."""
+        git_dir = os.path.join(repo_path, '.git')
+        head_path = os.path.join(git_dir, 'HEAD')
+        try:
+            fingerprint = [os.stat(head_path).st_mtime_ns]
+            with open(head_path) as f:
+                head = f.read().strip()
+        except OSError:
+            return None
+        if head.startswith('ref: '):
+            # Current branch's loose ref plus packed-refs (either may not exist)
+            for name in (head[len('ref: '):], 'packed-refs'):
+                try:
+                    fingerprint.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+                except OSError:
+                    fingerprint.append(None)
+        return fingerprint
+
     def get_repo_status(self, repo_path):
         """Get the current branch and status of a repository."""
         try:
-            # Get current branch
-            branch = subprocess.check_output(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                cwd=repo_path,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            ).strip()
-
-            # Get last commit hash
-            commit = subprocess.check_output(
-                ['git', 'rev-parse', '--short', 'HEAD'],
-                cwd=repo_path,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            ).strip()
-
-            # Get last commit date
-            date = subprocess.check_output(
-                ['git', 'log', '-1', '--format=%cd', '--date=short'],
-                cwd=repo_path,
+            # Reuse the cached commit/date when no ref file changed since
+            # the last run, saving the git log spawn entirely
+            fingerprint = self._ref_fingerprint(repo_path)
+            cache = self._load_status_cache()
+            cached = cache.get(repo_path)
+            if cached is not None and fingerprint is not None \
+                    and cached.get('fingerprint') == fingerprint:
+                commit, date = cached['commit'], cached['date']
+            else:
+                output = subprocess.check_output(
+                    ['git', '-C', repo_path, 'log', '-1',
+                     '--format=%h%x1f%cd', '--date=short'],
+                    stderr=subprocess.PIPE,
+                    universal_newlines=True
+                ).strip()
+                commit, date = output.split('\x1f')
+                if fingerprint is not None:
+                    cache[repo_path] = {
+                        'fingerprint': fingerprint,
+                        'commit': commit,
+                        'date': date
+                    }
+
+            # Branch and dirty files come from one porcelain-v2 status call,
+            # so update_repo does not need to spawn its own git status
+            status_output = subprocess.check_output(
+                ['git', '-C', repo_path, 'status', '--porcelain=v2', '--branch', '-z'],
                 stderr=subprocess.PIPE,
                 universal_newlines=True
-            ).strip()
+            )
+            branch = 'HEAD'
+            dirty = []
+            for entry in status_output.split('\0'):
+                if entry.startswith('# branch.head '):
+                    branch = entry[len('# branch.head '):]
+                elif entry and not entry.startswith('#'):
+                    dirty.append(entry)
 
             return {
                 'branch': branch,
                 'commit': commit,
                 'date': date,
-                'status': 'clean'
+                'dirty': dirty,
+                'status': 'dirty' if dirty else 'clean'
             }
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, ValueError):
             return None
 
-    def update_repo(self, repo_path):
+    def update_repo(self, repo_path, info=None):
         """Update a repository using git pull."""
         try:
-            # Check if there are uncommitted changes
-            status = subprocess.check_output(
-                ['git', 'status', '--porcelain'],
-                cwd=repo_path,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            ).strip()
+            # Reuse the status gathered by get_repo_status when available
+            if info is None:
+                info = self.get_repo_status(repo_path)
+            if info is None:
+                return False, "Not a git repository"
 
-            if status:
+            if info['dirty']:
                 return False, "Repository has uncommitted changes"
 
-            # Perform git pull
+            # Explicit fetch plus fast-forward merge instead of git pull:
+            # no hooks or merge editor, and multi-remote fetches parallelize.
+            # No --depth here: re-cutting the shallow boundary at the new tip
+            # disconnects it from the existing history and breaks the
+            # fast-forward, while a plain fetch in an already-shallow clone
+            # stays shallow and keeps the histories connected.
             result = subprocess.run(
-                ['git', 'pull'],
-                cwd=repo_path,
+                ['git', '-C', repo_path, 'fetch', '--quiet', '--prune', '--jobs=4'],
                 capture_output=True,
                 text=True
             )
+            if result.returncode != 0:
+                return False, f"Fetch failed: {result.stderr}"
 
+            result = subprocess.run(
+                ['git', '-C', repo_path, 'merge', '--ff-only', '@{u}'],
+                capture_output=True,
+                text=True
+            )
             if result.returncode == 0:
                 return True, "Successfully updated"
-            else:
-                return False, f"Update failed: {result.stderr}"
+            return False, f"Update failed: {result.stderr}"
         except subprocess.CalledProcessError as e:
             return False, f"Error updating repository: {str(e)}"
 
     def display_repos_table(self, repos):
         """Display repositories in a formatted table."""
-        table = Table(show_header=True, header_style="bold magenta")
+        table = Table(show_header=True, header_style="bold magenta", expand=False)
         table.add_column("Index", style="dim")
         table.add_column("Repository Name")
         table.add_column("Description")
         table.add_column("Stars", justify="right")
-        
+
+        # Build all cells up front so the add_row loop stays tight
+        rows = []
         for idx, repo in enumerate(repos, 1):
-            table.add_row(
-                str(idx),
-                repo["name"],
-                repo.get("description", "No description")[:100] + "..." if repo.get("description") else "No description",
-                str(repo.get("stargazers_count", 0))
-            )
-        
+            description = repo.get("description") or "No description"
+            if len(description) > 100:
+                description = f"{description[:100]}…"
+            rows.append((f"{idx}", repo["name"], description,
+                         f"{repo.get('stargazers_count', 0)}"))
+
+        for row in rows:
+            table.add_row(*row)
+
         console.print(table)
 
     def display_status_table(self, repos_info):
@@ -216,19 +505,66 @@ class GitHubDownloader:
             console=console
         ) as progress:
             task = progress.add_task("Downloading selected repositories...", total=len(selected_indices))
+
+            # One directory scan replaces a stat call per repository
+            with os.scandir(base_dir) as entries:
+                existing = {e.name for e in entries if e.is_dir(follow_symlinks=False)}
+
+            # Object sharing only works for full clones: a store seeded from
+            # shallow clones gains shallow roots and git refuses to use a
+            # shallow repository as a clone reference
+            shared_store = self._init_shared_store(base_dir) if self.full_history else None
+            jobs = []
             for idx in selected_indices:
                 repo = repos[idx - 1]  # Convert 1-based index to 0-based
                 repo_name = repo["name"]
                 repo_url = repo["clone_url"]
                 target_dir = os.path.join(base_dir, repo_name)
-                
-                if not os.path.exists(target_dir):
-                    self.download_repo(repo_url, target_dir)
-                else:
+
+                if repo_name in existing:
                     console.print(f"[yellow]Repository {repo_name} already exists, skipping...[/yellow]")
-                
+                    progress.update(task, advance=1)
+                    continue
+
+                jobs.append((repo_name, repo_url, target_dir, shared_store))
+
+            # Cloning is network/disk bound, so run several clones concurrently
+            if jobs:
+                max_concurrency = self.jobs or min(8, len(jobs))
+                asyncio.run(self._clone_many(jobs, progress, task, max_concurrency))
+
+    async def _clone_many(self, jobs, progress, task, max_concurrency=8):
+        """Drive many git clones from one event loop, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def clone(repo_name, repo_url, target_dir, reference):
+            async with semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *self._clone_command(repo_url, target_dir, reference),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                    env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+                )
+                _, stderr = await process.communicate()
+                if process.returncode != 0:
+                    console.print(f"[red]Failed to clone {repo_name}: "
+                                  f"{stderr.decode().strip()}[/red]")
+                elif reference:
+                    # Seed the shared store from the fresh local clone. The
+                    # refspec matters: --reference-if-able only advertises the
+                    # store's refs as haves, so objects reachable solely from
+                    # FETCH_HEAD would never be reused
+                    seeder = await asyncio.create_subprocess_exec(
+                        'git', '-C', reference, 'fetch', '--quiet', target_dir,
+                        f'+refs/heads/*:refs/remotes/{repo_name}/*',
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                    await seeder.wait()
                 progress.update(task, advance=1)
 
+        await asyncio.gather(*(clone(*job) for job in jobs))
+
     def download_all_repos(self, username):
         """Download all public repositories for a given username."""
         try:
@@ -283,8 +619,8 @@ class GitHubDownloader:
             console.print(Panel(f"Successfully downloaded {len(selected_indices)} repositories to {base_dir}",
                               title="[green]Download Complete![/green]"))
 
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
                 console.print(f"[red]Error: User '{username}' not found[/red]")
             else:
                 console.print(f"[red]Error: {str(e)}[/red]")
@@ -301,12 +637,18 @@ class GitHubDownloader:
             console.print(f"[red]Error: No repositories found for user '{username}' in {base_dir}[/red]")
             return
 
-        # Get status of all repositories
-        repos_info = {}
-        for repo_name in os.listdir(base_dir):
-            repo_path = os.path.join(base_dir, repo_name)
-            if os.path.isdir(repo_path):
-                repos_info[repo_name] = self.get_repo_status(repo_path)
+        # Collect paths of candidate repositories
+        repo_paths = {}
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if entry.name == self.SHARED_STORE_NAME:
+                    continue  # Skip the internal shared object store
+                if entry.is_dir(follow_symlinks=False):
+                    repo_paths[entry.name] = entry.path
+
+        # Status checks spawn independent git processes, so run them in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            repos_info = dict(zip(repo_paths, executor.map(self.get_repo_status, repo_paths.values())))
 
         # Display current status
         console.print("\n[bold]Current Repository Status:[/bold]")
@@ -314,6 +656,7 @@ class GitHubDownloader:
 
         # Ask for confirmation
         if not Confirm.ask("\nWould you like to update all repositories?"):
+            self._save_status_cache()
             return
 
         # Update repositories
@@ -323,27 +666,42 @@ class GitHubDownloader:
             console=console
         ) as progress:
             task = progress.add_task("Updating repositories...", total=len(repos_info))
-            for repo_name, info in repos_info.items():
-                if info:  # Only update if it's a valid git repository
-                    repo_path = os.path.join(base_dir, repo_name)
-                    success, message = self.update_repo(repo_path)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs or 16) as executor:
+                # Only update valid git repositories
+                futures = {
+                    executor.submit(self.update_repo, repo_paths[repo_name], info): repo_name
+                    for repo_name, info in repos_info.items() if info
+                }
+                skipped = len(repos_info) - len(futures)
+                if skipped:
+                    progress.update(task, advance=skipped)
+                for future in concurrent.futures.as_completed(futures):
+                    repo_name = futures[future]
+                    success, message = future.result()
                     if not success:
                         console.print(f"[yellow]Warning: {repo_name}: {message}[/yellow]")
-                progress.update(task, advance=1)
+                    progress.update(task, advance=1)
 
-        # Display updated status
+        # Display updated status, refreshing in parallel like the first pass
         console.print("\n[bold]Updated Repository Status:[/bold]")
-        for repo_name in repos_info:
-            repos_info[repo_name] = self.get_repo_status(os.path.join(base_dir, repo_name))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            repos_info = dict(zip(repos_info, executor.map(
+                self.get_repo_status, (repo_paths[name] for name in repos_info))))
+        self._save_status_cache()
         self.display_status_table(repos_info)
 
 @click.command()
 @click.argument('username')
 @click.option('--update', is_flag=True, help='Update all downloaded repositories')
 @click.option('--saveto', help='Directory to save repositories to (default: ~/Downloads)')
-def main(username, update, saveto):
+@click.option('--full-history/--shallow', default=False,
+              help='Clone full history instead of a shallow copy (default: shallow)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), help='Number of concurrent clones (default: up to 8)')
+@click.option('--token', multiple=True, help='GitHub API token; repeat to pool tokens (or set GITHUB_TOKENS)')
+def main(username, update, saveto, full_history, jobs, token):
     """Download or update repositories from a GitHub user."""
-    downloader = GitHubDownloader(save_path=saveto)
+    downloader = GitHubDownloader(save_path=saveto, full_history=full_history, jobs=jobs,
+                                  tokens=list(token) or None)
     
     # Print download location
     console.print(f"[bold]Repositories will be saved to:[/bold] {downloader.save_path}")